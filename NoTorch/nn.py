@@ -10,12 +10,17 @@ class Module:
 
     def zero_grad(self):
         for p in self.parameters():
-            p.grad = np.zeros_like(p.grad)
+            if p.grad is not None:
+                p.grad.fill(0.0)
 
 
 class Dense(Module):
     """
     Fully Connected Layer, with customizable activation function
+
+    accepts a single sample of shape (in_neurons,) or a batch of shape (batch, in_neurons)
+
+    weights are one contiguous row-major (out_neurons, in_neurons) matrix, so its grad is a single buffer too
     """
 
     def __init__(
@@ -31,19 +36,22 @@ class Dense(Module):
         self.use_bias = use_bias
         self.activation = activation
         self.weights = Tensor(
-            np.array(
-                [
-                    np.longdouble(np.random.randn(in_neurons))
-                    * math.sqrt(2.0 / in_neurons)
-                    for _ in range(out_neurons)
-                ]
-            )
+            np.random.randn(out_neurons, in_neurons).astype(np.float32)
+            * np.float32(math.sqrt(2.0 / in_neurons))
         )
-        self.bias = Tensor(np.ones(shape=[out_neurons]).astype(np.longdouble) * 0.01) if use_bias else None
+        self.bias = Tensor(np.full(out_neurons, 0.01, dtype=np.float32)) if use_bias else None
         self.batch_size = batch_size
 
     def __call__(self, x: np.ndarray):
-        return self.activation(Tensor.mat_vec_mul(self.weights, x) + self.bias) if self.use_bias else self.activation(Tensor.mat_vec_mul(self.weights, x))
+        x = Tensor._validate_input(x)
+
+        if x.data.ndim == 2:
+            # (batch, in) @ (in, out): one GEMM for the whole mini-batch
+            z = Tensor.mat_mul(x, self.weights.transpose())
+        else:
+            z = Tensor.mat_vec_mul(self.weights, x)
+
+        return self.activation(z + self.bias) if self.use_bias else self.activation(z)
 
     def parameters(self):
         return [self.weights, self.bias]
@@ -83,11 +91,81 @@ class MLP(Module):
             ]
             self.layers += [Dense(hidden_sizes[-1], out_features)]
 
+        self._compiled = False
+
     def __call__(self, x: np.ndarray):
+        if self._compiled:
+            return self._fused_forward(x)
         for layer in self.layers:
             x = layer(x)
         return x
 
+    def compile(self):
+        """
+        Run forward/backward as a single fused autograd node instead of one node per op
+
+        the fused pass assumes every layer has a bias, hidden layers apply relu and the
+        output layer applies no activation; anything else raises NotImplementedError
+        (see examples/compile_check.py for a gradient comparison against the uncompiled graph)
+        """
+        probe = Tensor(np.array([-1.0, 1.0], dtype=np.float32))
+        last = len(self.layers) - 1
+
+        for i, layer in enumerate(self.layers):
+            if not layer.use_bias:
+                raise NotImplementedError("compile requires every layer to use a bias")
+
+            out = layer.activation(probe)
+            if i < last:
+                # compare children by identity, Tensor.__eq__ is elementwise
+                is_relu = (
+                    isinstance(out, Tensor)
+                    and out._op == "relu"
+                    and len(out._children) == 1
+                    and out._children[0] is probe
+                )
+                if not is_relu:
+                    raise NotImplementedError("compile only supports relu hidden activations")
+            elif out is not probe:
+                raise NotImplementedError("compile only supports an identity output activation")
+
+        self._compiled = True
+        return self
+
+    def _fused_forward(self, x):
+        """
+        Forward pass in plain NumPy, caching layer inputs and relu masks for a hand-written backward
+        """
+        x = Tensor._validate_input(x)
+        weights = [layer.weights for layer in self.layers]
+        biases = [layer.bias for layer in self.layers]
+        last = len(self.layers) - 1
+
+        a = np.atleast_2d(x.data)
+        inputs, masks = [], []
+        for i in range(len(self.layers)):
+            inputs.append(a)
+            a = np.matmul(a, weights[i].data.T) + biases[i].data
+            if i < last:
+                masks.append(a > 0)
+                a = np.maximum(a, 0.0)
+
+        out = Tensor(a if x.data.ndim == 2 else a[0], (x, *weights, *biases), _op="mlp")
+
+        def _backward():
+            g = np.atleast_2d(out.grad)
+            for i in reversed(range(len(self.layers))):
+                if i < last:
+                    g = g * masks[i]
+                np.add(weights[i]._ensure_grad(), np.matmul(g.T, inputs[i]), out=weights[i].grad)
+                np.add(biases[i]._ensure_grad(), g.sum(axis=0), out=biases[i].grad)
+                g = np.matmul(g, weights[i].data)
+            np.add(x._ensure_grad(), g.reshape(x.data.shape), out=x.grad)
+
+        out._backward = _backward
+
+        return out
+
     def parameters(self):
         params = []
         for layer in self.layers:
@@ -17,6 +17,8 @@ class Tensor:
 
     unique_id = itertools.count()
 
+    __slots__ = ("data", "id", "_children", "grad", "_backward", "_op")
+
     def __init__(
         self,
         data: Union[np.ndarray, int, float, list],
@@ -26,8 +28,7 @@ class Tensor:
         self.data = Tensor._validate_init_input(data)
         self.id = next(self.unique_id)
         self._children = _children
-        self.grad = np.zeros_like(self.data)
-        self._prev = set(_children)
+        self.grad = None
         self._backward = lambda: None
         self._op = _op
 
@@ -36,13 +37,14 @@ class Tensor:
         Addition
         """
 
-        other: Tensor = Tensor._validate_input(other)
+        if other.__class__ is not Tensor:
+            other = Tensor._validate_input(other)
 
         out = Tensor(np.add(self.data, other.data), (self, other), _op="+")
 
         def _backward():
-            self.grad += out.grad
-            other.grad += out.grad
+            np.add(self._ensure_grad(), Tensor._unbroadcast(out.grad, self.data.shape), out=self.grad)
+            np.add(other._ensure_grad(), Tensor._unbroadcast(out.grad, other.data.shape), out=other.grad)
 
         out._backward = _backward
 
@@ -53,13 +55,21 @@ class Tensor:
         Multiplication
         """
 
-        other: Tensor = Tensor._validate_input(other)
+        if other.__class__ is not Tensor:
+            other = Tensor._validate_input(other)
 
         out = Tensor(np.multiply(self.data, other.data), (self, other), _op="*")
 
         def _backward():
-            self.grad += other.data * out.grad
-            other.grad += self.data * out.grad
+            if self.data.shape == out.data.shape:
+                self._accumulate_product(other.data, out.grad)
+            else:
+                np.add(self._ensure_grad(), Tensor._unbroadcast(other.data * out.grad, self.data.shape), out=self.grad)
+
+            if other.data.shape == out.data.shape:
+                other._accumulate_product(self.data, out.grad)
+            else:
+                np.add(other._ensure_grad(), Tensor._unbroadcast(self.data * out.grad, other.data.shape), out=other.grad)
 
         out._backward = _backward
 
@@ -71,12 +81,16 @@ class Tensor:
         """
         other: Tensor = Tensor._validate_input(other)
 
-        out = Tensor(
-            self.data**other.data, (self, other), _op="pow"
-        )
+        pow_val = self.data**other.data
+        out = Tensor(pow_val, (self, other), _op="pow")
 
         def _backward():
-            self.grad += (other.data * self.data ** (other.data - 1)) * out.grad
+            # d/dx x^n = n * x^n / x reuses the forward power, except where x == 0
+            if np.all(self.data != 0):
+                local_grad = other.data * pow_val / self.data
+            else:
+                local_grad = other.data * self.data ** (other.data - 1)
+            np.add(self._ensure_grad(), local_grad * out.grad, out=self.grad)
 
         out._backward = _backward
 
@@ -92,7 +106,7 @@ class Tensor:
         out = Tensor(np.log(self.data), (self,), _op="log")
 
         def _backward():
-            self.grad += (1 / self.data) * out.grad
+            np.add(self._ensure_grad(), (1 / self.data) * out.grad, out=self.grad)
 
         out._backward = _backward
 
@@ -105,7 +119,7 @@ class Tensor:
         out = Tensor(self.data.T, (self,), _op="transpose")
 
         def _backward():
-            self.grad += out.grad.T
+            np.add(self._ensure_grad(), out.grad.T, out=self.grad)
 
         out._backward = _backward
 
@@ -115,10 +129,25 @@ class Tensor:
         """
         Rectified Non-linearity
         """
-        out = Tensor(self.data * (self.data > 0), (self,), _op="relu")
+        mask = self.data > 0
+        out = Tensor(np.maximum(self.data, 0.0), (self,), _op="relu")
 
         def _backward():
-            self.grad += (out.data > 0) * out.grad
+            self._accumulate_product(mask, out.grad)
+
+        out._backward = _backward
+
+        return out
+
+    def sigmoid(self):
+        """
+        Logistic Sigmoid
+        """
+        s = 1.0 / (1.0 + np.exp(-self.data))
+        out = Tensor(s, (self,), _op="sigmoid")
+
+        def _backward():
+            np.add(self._ensure_grad(), s * (1.0 - s) * out.grad, out=self.grad)
 
         out._backward = _backward
 
@@ -131,23 +160,23 @@ class Tensor:
         out = Tensor(np.exp(self.data), (self,), _op="exp")
 
         def _backward():
-            self.grad += np.exp(self.data)
-        
+            np.add(self._ensure_grad(), out.data * out.grad, out=self.grad)
+
         out._backward = _backward
 
         return out
 
     def __gt__(self, other):
-        return self.data > Tensor._validate_input(other).data
+        return self.data > Tensor._as_array(other)
 
     def __lt__(self, other):
-        return self.data < Tensor._validate_input(other).data
+        return self.data < Tensor._as_array(other)
 
     def __ge__(self, other):
-        return self.data >= Tensor._validate_input(other).data
+        return self.data >= Tensor._as_array(other)
 
     def __eq__(self, other):
-        return self.data == Tensor._validate_input(other).data
+        return self.data == Tensor._as_array(other)
 
     def __neg__(self):
         return self * -1
@@ -174,18 +203,43 @@ class Tensor:
         nodes = []
         visited = set()
 
-        def topological_sort(v):
-            if v not in visited:
-                visited.add(v)
-                for child in set(v._children):
-                    topological_sort(child)
+        # iterative post-order DFS, avoids the recursion limit on deep graphs
+        stack = [(self, False)]
+        while stack:
+            v, processed = stack.pop()
+            if processed:
                 nodes.append(v)
+                continue
+            if v in visited:
+                continue
+            visited.add(v)
+            stack.append((v, True))
+            for child in v._children:
+                stack.append((child, False))
+
+        self.grad = np.ones_like(self.data)
+        for v in reversed(nodes):
+            # nodes that received no gradient (e.g. exponents) have nothing to propagate
+            if v.grad is not None:
+                v._backward()
 
-        topological_sort(self)
+    def _ensure_grad(self):
+        """
+        Materialize a zero gradient on first accumulation
+        """
+        if self.grad is None:
+            self.grad = np.zeros_like(self.data)
+        return self.grad
 
-        self.grad = np.ones_like(self.grad)
-        for v in reversed(nodes):
-            v._backward()
+    def _accumulate_product(self, a, b):
+        """
+        self.grad += a * b, with a * b shaped like self.data;
+        the first accumulation writes the product straight into a fresh gradient
+        """
+        if self.grad is None and np.result_type(a, b) == self.data.dtype:
+            self.grad = np.multiply(a, b, out=np.empty_like(self.data))
+        else:
+            np.add(self._ensure_grad(), np.multiply(a, b), out=self.grad)
 
     def __repr__(self):
         return f"Tensor with val {self.data} and grad {self.grad}"
@@ -207,7 +261,7 @@ class Tensor:
         out = Tensor(np.multiply(a.data, b.data), (a,), _op="one_way_grad_mul")
 
         def _backward():
-            a.grad += b.data * out.grad
+            np.add(a._ensure_grad(), b.data * out.grad, out=a.grad)
 
         out._backward = _backward
 
@@ -224,8 +278,8 @@ class Tensor:
         out = Tensor(np.matmul(mat_a.data, mat_b.data), (mat_a, mat_b), _op="mat_mul")
 
         def _backward():
-            mat_a.grad += np.matmul(out.grad, mat_b.data.T)
-            mat_b.grad += np.matmul(mat_a.data.T, out.grad)
+            np.add(mat_a._ensure_grad(), np.matmul(out.grad, mat_b.data.T), out=mat_a.grad)
+            np.add(mat_b._ensure_grad(), np.matmul(mat_a.data.T, out.grad), out=mat_b.grad)
         
         out._backward = _backward
         return out
@@ -241,8 +295,25 @@ class Tensor:
         out = Tensor(np.matmul(mat.data, vec.data), (mat, vec), _op="mat_vec_mul")
 
         def _backward():
-            mat.grad += np.outer(out.grad.T, vec.data)
-            vec.grad += np.matmul(mat.data.T, out.grad)
+            np.add(mat._ensure_grad(), np.outer(out.grad.T, vec.data), out=mat.grad)
+            np.add(vec._ensure_grad(), np.matmul(mat.data.T, out.grad), out=vec.grad)
+
+        out._backward = _backward
+        return out
+
+    @staticmethod
+    def dot1d(a, b):
+        """
+        Inner product of two vectors using np.dot
+        """
+        a = Tensor._validate_input(a)
+        b = Tensor._validate_input(b)
+
+        out = Tensor(np.array([np.dot(a.data, b.data)]), (a, b), _op="dot1d")
+
+        def _backward():
+            a._accumulate_product(b.data, out.grad)
+            b._accumulate_product(a.data, out.grad)
 
         out._backward = _backward
         return out
@@ -255,7 +326,7 @@ class Tensor:
         out = Tensor(np.sum(tensor_in.data, axis=axis), (tensor_in,), _op="sum")
 
         def _backward():
-            tensor_in.grad += np.expand_dims(out.grad, axis=axis)
+            np.add(tensor_in._ensure_grad(), np.expand_dims(out.grad, axis=axis), out=tensor_in.grad)
 
         out._backward = _backward
 
@@ -274,7 +345,7 @@ class Tensor:
 
         def _backward():
             for i in range(len(tensors)):
-                tensors[i].grad += out.grad[i]
+                np.add(tensors[i]._ensure_grad(), out.grad[i], out=tensors[i].grad)
 
         out._backward = _backward
 
@@ -288,7 +359,8 @@ class Tensor:
         out = [Tensor(t, (tensor,), _op="unstack") for t in np.split(tensor.data, tensor.data.shape[0], axis=0)]
 
         def _backward(idx):
-            tensor.grad += np.concatenate([np.zeros_like(t.data) if i != idx else t.grad for i, t in enumerate(out)], axis=0)
+            grad_slice = tensor._ensure_grad()[idx : idx + 1]
+            np.add(grad_slice, out[idx].grad, out=grad_slice)
 
         for i in range(len(out)):
             out[i]._backward = partial(_backward, i)
@@ -301,31 +373,47 @@ class Tensor:
         assert isinstance(input, (np.ndarray, int, float, list)), f"{type(input)}"
 
         if isinstance(input, int):
-            return np.longdouble([float(input)])
+            return np.asarray([input], dtype=np.float32)
 
         elif isinstance(input, float):
-            return np.longdouble([input])
+            return np.asarray([input], dtype=np.float32)
 
         elif isinstance(input, list):
-            return np.longdouble([float(d) for d in input])
+            return np.asarray(input, dtype=np.float32)
 
         elif isinstance(input, np.ndarray):
-            assert input.dtype in (
-                np.longdouble,
-                np.half,
-                np.float16,
-                np.float32,
-                np.float64,
-                np.float128,
-                np.single,
-                np.double,
-            ), "dtype must be float"
+            assert input.dtype in (np.float32, np.float64), "dtype must be float32 or float64"
             return input
 
+    @staticmethod
+    def _unbroadcast(grad: np.ndarray, shape: tuple) -> np.ndarray:
+        """
+        Sum grad over the axes that were broadcast when an operand of the given shape produced it
+        """
+        if grad.shape == shape:
+            return grad
+
+        lead = grad.ndim - len(shape)
+        axes = tuple(range(lead)) + tuple(
+            lead + i for i, n in enumerate(shape) if n == 1 and grad.shape[lead + i] != 1
+        )
+        return np.add.reduce(grad, axis=axes, keepdims=True).reshape(shape)
+
+    @staticmethod
+    def _as_array(input):
+        """
+        Raw ndarray view of an operand, without wrapping it in a Tensor
+        """
+        return input.data if isinstance(input, Tensor) else np.asarray(input)
+
     @staticmethod
     def _validate_input(input):
 
-        if isinstance(input, np.ndarray):
+        # exact type check first: Tensor operands are by far the common case
+        if input.__class__ is Tensor:
+            return input
+
+        elif isinstance(input, np.ndarray):
             return Tensor(input, ())
 
         elif isinstance(input, Tensor):
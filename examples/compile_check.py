@@ -0,0 +1,53 @@
+import copy
+from NoTorch.nn import MLP
+import numpy as np
+
+"""
+Check that MLP.compile() matches the uncompiled autograd graph
+
+Builds MLPs with 0, 1 and 5 hidden layers, compiles a deep copy of each and compares
+outputs and parameter gradients on a single sample and on a batch, then checks that
+networks the fused pass does not support are rejected with NotImplementedError
+
+"""
+IN_SIZE = 3
+OUT_SIZE = 2
+HIDDEN = 4
+
+
+def forward_backward(net, x):
+    net.zero_grad()
+    out = net(x)
+    out.backward()
+    return out.data, [p.grad for p in net.parameters()]
+
+
+for hidden_sizes in ([], [HIDDEN], [HIDDEN] * 5):
+    net = MLP(in_features=IN_SIZE, out_features=OUT_SIZE, hidden_sizes=hidden_sizes)
+    compiled = copy.deepcopy(net).compile()
+
+    for x in (np.random.randn(IN_SIZE), np.random.randn(5, IN_SIZE)):
+        out, grads = forward_backward(net, x)
+        out_c, grads_c = forward_backward(compiled, x)
+
+        assert np.allclose(out, out_c, atol=1e-5), f"output mismatch for {hidden_sizes}"
+        for g, g_c in zip(grads, grads_c):
+            assert np.allclose(g, g_c, atol=1e-5), f"gradient mismatch for {hidden_sizes}"
+
+        print(f"hidden sizes {hidden_sizes}, input shape {x.shape}: compiled matches")
+
+
+unsupported = {
+    "non-relu activation": MLP(IN_SIZE, OUT_SIZE, [HIDDEN], hidden_activation=lambda x: x.sigmoid()),
+    "op before relu": MLP(IN_SIZE, OUT_SIZE, [HIDDEN], hidden_activation=lambda x: (x * 1.0).relu()),
+    "layer without bias": MLP(IN_SIZE, OUT_SIZE, [HIDDEN]),
+}
+unsupported["layer without bias"].layers[0].use_bias = False
+
+for name, net in unsupported.items():
+    try:
+        net.compile()
+    except NotImplementedError:
+        print(f"{name}: rejected")
+    else:
+        raise AssertionError(f"compile accepted an unsupported network: {name}")